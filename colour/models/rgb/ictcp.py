@@ -28,13 +28,13 @@ R-REC-BT.2100-2-201807-I!!PDF-E.pdf
 
 import numpy as np
 
-from colour.algebra import vector_dot
+from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
 from colour.colorimetry import CCS_ILLUMINANTS
 from colour.models.rgb import RGB_COLOURSPACES, RGB_to_XYZ, XYZ_to_RGB
 from colour.models.rgb.transfer_functions import (
     eotf_ST2084, eotf_inverse_ST2084, oetf_HLG_BT2100, oetf_inverse_HLG_BT2100)
-from colour.utilities import (domain_range_scale, from_range_1, to_domain_1,
-                              validate_method)
+from colour.utilities import (as_float_array, domain_range_scale,
+                              get_domain_range_scale, validate_method)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -111,6 +111,270 @@ normalised cone responses matrix as given in *ITU-R BT.2100-2*.
 MATRIX_ICTCP_ICTCP_TO_LMS_P_HLG_BT2100_2 : array_like, (3, 3)
 """
 
+# The transposed matrices are cached so that they can be applied to arrays of
+# vectors with a single "np.matmul" call, they are stored with the
+# "colour.constant.DEFAULT_FLOAT_DTYPE" type so that a "float32" precision
+# setting does not get promoted to "float64" by the matrix products.
+_MATRIX_ICTCP_RGB_TO_LMS_T = as_float_array(
+    np.transpose(MATRIX_ICTCP_RGB_TO_LMS))
+"""
+Transposed :attr:`colour.models.rgb.ictcp.MATRIX_ICTCP_RGB_TO_LMS` matrix.
+
+_MATRIX_ICTCP_RGB_TO_LMS_T : array_like, (3, 3)
+"""
+
+_MATRIX_ICTCP_LMS_TO_RGB_T = as_float_array(
+    np.transpose(MATRIX_ICTCP_LMS_TO_RGB))
+"""
+Transposed :attr:`colour.models.rgb.ictcp.MATRIX_ICTCP_LMS_TO_RGB` matrix.
+
+_MATRIX_ICTCP_LMS_TO_RGB_T : array_like, (3, 3)
+"""
+
+_MATRIX_ICTCP_LMS_P_TO_ICTCP_T = as_float_array(
+    np.transpose(MATRIX_ICTCP_LMS_P_TO_ICTCP))
+"""
+Transposed :attr:`colour.models.rgb.ictcp.MATRIX_ICTCP_LMS_P_TO_ICTCP` matrix.
+
+_MATRIX_ICTCP_LMS_P_TO_ICTCP_T : array_like, (3, 3)
+"""
+
+_MATRIX_ICTCP_ICTCP_TO_LMS_P_T = as_float_array(
+    np.transpose(MATRIX_ICTCP_ICTCP_TO_LMS_P))
+"""
+Transposed :attr:`colour.models.rgb.ictcp.MATRIX_ICTCP_ICTCP_TO_LMS_P` matrix.
+
+_MATRIX_ICTCP_ICTCP_TO_LMS_P_T : array_like, (3, 3)
+"""
+
+_MATRIX_ICTCP_LMS_P_TO_ICTCP_HLG_BT2100_2_T = as_float_array(
+    np.transpose(MATRIX_ICTCP_LMS_P_TO_ICTCP_HLG_BT2100_2))
+"""
+Transposed
+:attr:`colour.models.rgb.ictcp.MATRIX_ICTCP_LMS_P_TO_ICTCP_HLG_BT2100_2`
+matrix.
+
+_MATRIX_ICTCP_LMS_P_TO_ICTCP_HLG_BT2100_2_T : array_like, (3, 3)
+"""
+
+_MATRIX_ICTCP_ICTCP_TO_LMS_P_HLG_BT2100_2_T = as_float_array(
+    np.transpose(MATRIX_ICTCP_ICTCP_TO_LMS_P_HLG_BT2100_2))
+"""
+Transposed
+:attr:`colour.models.rgb.ictcp.MATRIX_ICTCP_ICTCP_TO_LMS_P_HLG_BT2100_2`
+matrix.
+
+_MATRIX_ICTCP_ICTCP_TO_LMS_P_HLG_BT2100_2_T : array_like, (3, 3)
+"""
+
+_MATRIX_ICTCP_XYZ_TO_LMS_T = as_float_array(
+    np.transpose(
+        np.dot(MATRIX_ICTCP_RGB_TO_LMS,
+               RGB_COLOURSPACES['ITU-R BT.2020'].matrix_XYZ_to_RGB)))
+"""
+Transposed *CIE XYZ* tristimulus values to normalised cone responses matrix,
+composed with the *ITU-R BT.2020* colourspace matrix for the common case where
+no chromatic adaptation is required.
+
+_MATRIX_ICTCP_XYZ_TO_LMS_T : array_like, (3, 3)
+"""
+
+_MATRIX_ICTCP_LMS_TO_XYZ_T = as_float_array(
+    np.transpose(
+        np.dot(RGB_COLOURSPACES['ITU-R BT.2020'].matrix_RGB_to_XYZ,
+               MATRIX_ICTCP_LMS_TO_RGB)))
+"""
+Transposed normalised cone responses to *CIE XYZ* tristimulus values matrix,
+composed with the *ITU-R BT.2020* colourspace matrix for the common case where
+no chromatic adaptation is required.
+
+_MATRIX_ICTCP_LMS_TO_XYZ_T : array_like, (3, 3)
+"""
+
+_BLOCK_SIZE_ICTCP = 16384
+"""
+Number of vectors processed at once by the :math:`IC_TC_P` colour encoding
+definitions when converting large arrays, chosen so that the intermediate
+arrays stay resident in the processor caches.
+
+_BLOCK_SIZE_ICTCP : int
+"""
+
+
+def _domain_range_scale_factor():
+    """
+    Returns the domain-range scale factor of the :math:`IC_TC_P` colour
+    encoding definitions for the current domain-range scale.
+
+    Returns
+    -------
+    numeric
+        Domain-range scale factor.
+    """
+
+    # Mirrors "to_domain_1(scale_factor=100)" and
+    # "from_range_1(scale_factor=100)", the factor being folded into the
+    # cached matrices rather than applied to the input and output arrays.
+    return 100 if get_domain_range_scale() == '100' else 1
+
+
+def _evaluate_blockwise(definition, a, matrix_T, method, L_p, factor):
+    """
+    Evaluates given :math:`IC_TC_P` colour encoding definition on consecutive
+    blocks of :attr:`colour.models.rgb.ictcp._BLOCK_SIZE_ICTCP` vectors of
+    given array.
+
+    Parameters
+    ----------
+    definition : callable
+        :math:`IC_TC_P` colour encoding definition to evaluate, i.e.
+        :func:`colour.models.rgb.ictcp._encode_ICtCp` or
+        :func:`colour.models.rgb.ictcp._decode_ICtCp`.
+    a : ndarray
+        Array of vectors to process, the array is processed at once if its
+        last dimension is not 3 so that the matrix product raises the usual
+        exception.
+    matrix_T : ndarray
+        Transposed matrix forwarded to given definition.
+    method : unicode
+        Computation method forwarded to given definition.
+    L_p : numeric or array_like
+        Display peak luminance :math:`cd/m^2` forwarded to given definition,
+        the array is processed at once if it is not a *numeric*.
+    factor : numeric
+        Domain-range scale factor forwarded to given definition.
+
+    Returns
+    -------
+    ndarray
+        Processed array of vectors.
+    """
+
+    if (a.size <= _BLOCK_SIZE_ICTCP * 3 or a.shape[-1] != 3 or
+            np.ndim(L_p) != 0):
+        return definition(a, matrix_T, method, L_p, factor)
+
+    shape = a.shape
+    a = np.reshape(a, (-1, 3))
+    b = np.empty_like(a)
+
+    for i in range(0, a.shape[0], _BLOCK_SIZE_ICTCP):
+        b[i:i + _BLOCK_SIZE_ICTCP] = definition(a[i:i + _BLOCK_SIZE_ICTCP],
+                                                matrix_T, method, L_p, factor)
+
+    return np.reshape(b, shape)
+
+
+def _encode_ICtCp(a, matrix_to_LMS_T, method='Dolby 2016', L_p=10000,
+                  factor=1):
+    """
+    Converts given array to normalised cone responses with given transposed
+    matrix and then to :math:`IC_TC_P` colour encoding.
+
+    Parameters
+    ----------
+    a : ndarray
+        Array to convert, e.g. *ITU-R BT.2020* colourspace array.
+    matrix_to_LMS_T : ndarray
+        Transposed matrix converting given array to normalised cone
+        responses.
+    method : unicode, optional
+        Computation method, see :func:`colour.RGB_to_ICtCp` definition.
+    L_p : numeric, optional
+        Display peak luminance :math:`cd/m^2` for *SMPTE ST 2084:2014*
+        non-linear encoding.
+    factor : numeric, optional
+        Domain-range scale factor of the input and output arrays, folded into
+        the matrices rather than applied to the arrays.
+
+    Returns
+    -------
+    ndarray
+        :math:`IC_TC_P` colour encoding array.
+    """
+
+    method = validate_method(method, [
+        'Dolby 2016', 'ITU-R BT.2100-1 HLG', 'ITU-R BT.2100-1 PQ',
+        'ITU-R BT.2100-2 HLG', 'ITU-R BT.2100-2 PQ'
+    ])
+
+    is_hlg_method = 'hlg' in method
+    is_BT2100_2_method = '2100-2' in method
+
+    matrix_to_ICtCp_T = (_MATRIX_ICTCP_LMS_P_TO_ICTCP_HLG_BT2100_2_T
+                         if (is_hlg_method and is_BT2100_2_method) else
+                         _MATRIX_ICTCP_LMS_P_TO_ICTCP_T)
+
+    # Scaling the matrices only when required keeps the fixed cost low for
+    # small inputs, e.g. single vectors.
+    if factor != 1:
+        matrix_to_LMS_T = matrix_to_LMS_T / factor
+        matrix_to_ICtCp_T = matrix_to_ICtCp_T * factor
+
+    LMS = np.matmul(a, matrix_to_LMS_T)
+
+    with domain_range_scale('ignore'):
+        LMS_p = (oetf_HLG_BT2100(LMS)
+                 if is_hlg_method else eotf_inverse_ST2084(LMS, L_p))
+
+    return np.matmul(LMS_p, matrix_to_ICtCp_T)
+
+
+def _decode_ICtCp(ICtCp,
+                  matrix_from_LMS_T,
+                  method='Dolby 2016',
+                  L_p=10000,
+                  factor=1):
+    """
+    Converts from :math:`IC_TC_P` colour encoding to normalised cone responses
+    and then to the output array with given transposed matrix.
+
+    Parameters
+    ----------
+    ICtCp : ndarray
+        :math:`IC_TC_P` colour encoding array.
+    matrix_from_LMS_T : ndarray
+        Transposed matrix converting normalised cone responses to the output
+        array, e.g. *ITU-R BT.2020* colourspace array.
+    method : unicode, optional
+        Computation method, see :func:`colour.ICtCp_to_RGB` definition.
+    L_p : numeric, optional
+        Display peak luminance :math:`cd/m^2` for *SMPTE ST 2084:2014*
+        non-linear encoding.
+    factor : numeric, optional
+        Domain-range scale factor of the input and output arrays, folded into
+        the matrices rather than applied to the arrays.
+
+    Returns
+    -------
+    ndarray
+        Converted array.
+    """
+
+    method = validate_method(method, [
+        'Dolby 2016', 'ITU-R BT.2100-1 HLG', 'ITU-R BT.2100-1 PQ',
+        'ITU-R BT.2100-2 HLG', 'ITU-R BT.2100-2 PQ'
+    ])
+
+    is_hlg_method = 'hlg' in method
+    is_BT2100_2_method = '2100-2' in method
+
+    matrix_to_LMS_p_T = (_MATRIX_ICTCP_ICTCP_TO_LMS_P_HLG_BT2100_2_T
+                         if (is_hlg_method and is_BT2100_2_method) else
+                         _MATRIX_ICTCP_ICTCP_TO_LMS_P_T)
+
+    if factor != 1:
+        matrix_to_LMS_p_T = matrix_to_LMS_p_T / factor
+        matrix_from_LMS_T = matrix_from_LMS_T * factor
+
+    LMS_p = np.matmul(ICtCp, matrix_to_LMS_p_T)
+
+    with domain_range_scale('ignore'):
+        LMS = (oetf_inverse_HLG_BT2100(LMS_p)
+               if is_hlg_method else eotf_ST2084(LMS_p, L_p))
+
+    return np.matmul(LMS, matrix_from_LMS_T)
+
 
 def RGB_to_ICtCp(RGB, method='Dolby 2016', L_p=10000):
     """
@@ -204,26 +468,12 @@ def RGB_to_ICtCp(RGB, method='Dolby 2016', L_p=10000):
     array([ 0.6256789..., -0.0198449...,  0.3591125...])
     """
 
-    RGB = to_domain_1(RGB)
-    method = validate_method(method, [
-        'Dolby 2016', 'ITU-R BT.2100-1 HLG', 'ITU-R BT.2100-1 PQ',
-        'ITU-R BT.2100-2 HLG', 'ITU-R BT.2100-2 PQ'
-    ])
-
-    is_hlg_method = 'hlg' in method
-    is_BT2100_2_method = '2100-2' in method
-
-    LMS = vector_dot(MATRIX_ICTCP_RGB_TO_LMS, RGB)
-
-    with domain_range_scale('ignore'):
-        LMS_p = (oetf_HLG_BT2100(LMS)
-                 if is_hlg_method else eotf_inverse_ST2084(LMS, L_p))
+    RGB = as_float_array(RGB)
 
-    ICtCp = (vector_dot(MATRIX_ICTCP_LMS_P_TO_ICTCP_HLG_BT2100_2, LMS_p)
-             if (is_hlg_method and is_BT2100_2_method) else vector_dot(
-                 MATRIX_ICTCP_LMS_P_TO_ICTCP, LMS_p))
+    factor = _domain_range_scale_factor()
 
-    return from_range_1(ICtCp)
+    return _evaluate_blockwise(_encode_ICtCp, RGB, _MATRIX_ICTCP_RGB_TO_LMS_T,
+                               method, L_p, factor)
 
 
 def ICtCp_to_RGB(ICtCp, method='Dolby 2016', L_p=10000):
@@ -318,26 +568,12 @@ def ICtCp_to_RGB(ICtCp, method='Dolby 2016', L_p=10000):
     array([ 0.4562052...,  0.0308107...,  0.0409195...])
     """
 
-    ICtCp = to_domain_1(ICtCp)
-    method = validate_method(method, [
-        'Dolby 2016', 'ITU-R BT.2100-1 HLG', 'ITU-R BT.2100-1 PQ',
-        'ITU-R BT.2100-2 HLG', 'ITU-R BT.2100-2 PQ'
-    ])
+    ICtCp = as_float_array(ICtCp)
 
-    is_hlg_method = 'hlg' in method
-    is_BT2100_2_method = '2100-2' in method
-
-    LMS_p = (vector_dot(MATRIX_ICTCP_ICTCP_TO_LMS_P_HLG_BT2100_2, ICtCp)
-             if (is_hlg_method and is_BT2100_2_method) else vector_dot(
-                 MATRIX_ICTCP_ICTCP_TO_LMS_P, ICtCp))
-
-    with domain_range_scale('ignore'):
-        LMS = (oetf_inverse_HLG_BT2100(LMS_p)
-               if is_hlg_method else eotf_ST2084(LMS_p, L_p))
-
-    RGB = vector_dot(MATRIX_ICTCP_LMS_TO_RGB, LMS)
+    factor = _domain_range_scale_factor()
 
-    return from_range_1(RGB)
+    return _evaluate_blockwise(_decode_ICtCp, ICtCp,
+                               _MATRIX_ICTCP_LMS_TO_RGB_T, method, L_p, factor)
 
 
 def XYZ_to_ICtCp(XYZ,
@@ -447,6 +683,22 @@ def XYZ_to_ICtCp(XYZ,
 
     BT2020 = RGB_COLOURSPACES['ITU-R BT.2020']
 
+    if chromatic_adaptation_transform is not None:
+        validate_method(
+            chromatic_adaptation_transform, CHROMATIC_ADAPTATION_TRANSFORMS,
+            '"{0}" chromatic adaptation transform is invalid, '
+            'it must be one of {1}!')
+
+    if (chromatic_adaptation_transform is None or
+            np.array_equal(illuminant, BT2020.whitepoint)):
+        XYZ = as_float_array(XYZ)
+
+        factor = _domain_range_scale_factor()
+
+        return _evaluate_blockwise(_encode_ICtCp, XYZ,
+                                   _MATRIX_ICTCP_XYZ_TO_LMS_T, method, L_p,
+                                   factor)
+
     RGB = XYZ_to_RGB(
         XYZ,
         illuminant,
@@ -562,10 +814,26 @@ def ICtCp_to_XYZ(ICtCp,
     array([ 0.2065400...,  0.1219722...,  0.0513695...])
     """
 
-    RGB = ICtCp_to_RGB(ICtCp, method, L_p)
-
     BT2020 = RGB_COLOURSPACES['ITU-R BT.2020']
 
+    if chromatic_adaptation_transform is not None:
+        validate_method(
+            chromatic_adaptation_transform, CHROMATIC_ADAPTATION_TRANSFORMS,
+            '"{0}" chromatic adaptation transform is invalid, '
+            'it must be one of {1}!')
+
+    if (chromatic_adaptation_transform is None or
+            np.array_equal(illuminant, BT2020.whitepoint)):
+        ICtCp = as_float_array(ICtCp)
+
+        factor = _domain_range_scale_factor()
+
+        return _evaluate_blockwise(_decode_ICtCp, ICtCp,
+                                   _MATRIX_ICTCP_LMS_TO_XYZ_T, method, L_p,
+                                   factor)
+
+    RGB = ICtCp_to_RGB(ICtCp, method, L_p)
+
     XYZ = RGB_to_XYZ(
         RGB,
         BT2020.whitepoint,
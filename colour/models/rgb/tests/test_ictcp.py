@@ -5,10 +5,14 @@ Defines unit tests for :mod:`colour.models.rgb.ictcp` module.
 
 import numpy as np
 import unittest
-from itertools import permutations
+from itertools import product
 
 from colour.models.rgb import (RGB_to_ICtCp, ICtCp_to_RGB, XYZ_to_ICtCp,
                                ICtCp_to_XYZ)
+from colour.models.rgb.ictcp import (
+    _BLOCK_SIZE_ICTCP, _MATRIX_ICTCP_RGB_TO_LMS_T, _MATRIX_ICTCP_LMS_TO_RGB_T,
+    _MATRIX_ICTCP_XYZ_TO_LMS_T, _MATRIX_ICTCP_LMS_TO_XYZ_T, _encode_ICtCp,
+    _decode_ICtCp)
 from colour.utilities import domain_range_scale, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -24,6 +28,53 @@ __all__ = [
 ]
 
 
+def _read_only_array(a):
+    """
+    Returns given array as a read-only :class:`np.ndarray` shared by the unit
+    tests.
+    """
+
+    a = np.array(a)
+    a.setflags(write=False)
+
+    return a
+
+
+_RGB = _read_only_array([0.45620519, 0.03081071, 0.04091952])
+_ICTCP = _read_only_array([0.07351364, 0.00475253, 0.09351596])
+_ICTCP_L_P_4000 = _read_only_array([0.10516931, 0.00514031, 0.12318730])
+_ICTCP_L_P_1000 = _read_only_array([0.17079612, 0.00485580, 0.17431356])
+_ICTCP_HLG_BT2100_1 = _read_only_array([0.62567899, -0.03622422, 0.67786522])
+_ICTCP_HLG_BT2100_2 = _read_only_array([0.62567899, -0.01984490, 0.35911259])
+_XYZ = _read_only_array([0.20654008, 0.12197225, 0.05136952])
+_ICTCP_XYZ = _read_only_array([0.06858097, -0.00283842, 0.06020983])
+_CCS_D50 = _read_only_array([0.34570, 0.35850])
+_ICTCP_XYZ_D50 = _read_only_array([0.06792437, 0.00452089, 0.05514480])
+_ICTCP_XYZ_D50_BRADFORD = _read_only_array(
+    [0.06783951, 0.00476111, 0.05523093])
+_ICTCP_XYZ_L_P_4000 = _read_only_array([0.09871102, -0.00447247, 0.07984812])
+_ICTCP_XYZ_L_P_1000 = _read_only_array([0.16173872, -0.00792543, 0.11409458])
+_ICTCP_XYZ_HLG_BT2100_1 = _read_only_array(
+    [0.59242792, -0.06824263, 0.47421473])
+_ICTCP_XYZ_HLG_BT2100_2 = _read_only_array(
+    [0.59242792, -0.03740730, 0.25122675])
+
+_DOMAIN_RANGE_SCALES = (('reference', 1), (1, 1), (100, 100))
+
+_SHAPES_BLOCKWISE = ((_BLOCK_SIZE_ICTCP + 7, 3),
+                     (3, _BLOCK_SIZE_ICTCP // 3 + 1, 3))
+
+_SHAPES_BLOCKWISE_INVALID = ((_BLOCK_SIZE_ICTCP * 3, 2),
+                             (_BLOCK_SIZE_ICTCP * 3, 4))
+
+_CASES_BLOCKWISE = tuple(
+    _read_only_array(np.random.RandomState(4).random_sample(shape))
+    for shape in _SHAPES_BLOCKWISE)
+
+_CASES_NAN = _read_only_array(
+    list(product([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan], repeat=3)))
+
+
 class TestRGB_to_ICtCp(unittest.TestCase):
     """
     Defines :func:`colour.models.rgb.ictcp.TestRGB_to_ICtCp` definition unit
@@ -35,50 +86,44 @@ class TestRGB_to_ICtCp(unittest.TestCase):
         Tests :func:`colour.models.rgb.ictcp.RGB_to_ICtCp` definition.
         """
 
-        np.testing.assert_almost_equal(
-            RGB_to_ICtCp(np.array([0.45620519, 0.03081071, 0.04091952])),
-            np.array([0.07351364, 0.00475253, 0.09351596]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            RGB_to_ICtCp(
-                np.array([0.45620519, 0.03081071, 0.04091952]), L_p=4000),
-            np.array([0.10516931, 0.00514031, 0.12318730]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            RGB_to_ICtCp(
-                np.array([0.45620519, 0.03081071, 0.04091952]), L_p=1000),
-            np.array([0.17079612, 0.00485580, 0.17431356]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            RGB_to_ICtCp(
-                np.array([0.45620519, 0.03081071, 0.04091952]),
-                method='ITU-R BT.2100-1 PQ'),
-            np.array([0.07351364, 0.00475253, 0.09351596]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            RGB_to_ICtCp(
-                np.array([0.45620519, 0.03081071, 0.04091952]),
-                method='ITU-R BT.2100-2 PQ'),
-            np.array([0.07351364, 0.00475253, 0.09351596]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            RGB_to_ICtCp(
-                np.array([0.45620519, 0.03081071, 0.04091952]),
-                method='ITU-R BT.2100-1 HLG'),
-            np.array([0.62567899, -0.03622422, 0.67786522]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            RGB_to_ICtCp(
-                np.array([0.45620519, 0.03081071, 0.04091952]),
-                method='ITU-R BT.2100-2 HLG'),
-            np.array([0.62567899, -0.01984490, 0.35911259]),
-            decimal=7)
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB), _ICTCP, atol=1e-7, rtol=0)
+
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB, L_p=4000), _ICTCP_L_P_4000, atol=1e-7, rtol=0)
+
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB, L_p=1000), _ICTCP_L_P_1000, atol=1e-7, rtol=0)
+
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB, L_p=np.array([[1000], [4000]])),
+            np.array([_ICTCP_L_P_1000, _ICTCP_L_P_4000]),
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB, method='ITU-R BT.2100-1 PQ'),
+            _ICTCP,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB, method='ITU-R BT.2100-2 PQ'),
+            _ICTCP,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB, method='ITU-R BT.2100-1 HLG'),
+            _ICTCP_HLG_BT2100_1,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            RGB_to_ICtCp(_RGB, method='ITU-R BT.2100-2 HLG'),
+            _ICTCP_HLG_BT2100_2,
+            atol=1e-7,
+            rtol=0)
 
     def test_n_dimensional_RGB_to_ICtCp(self):
         """
@@ -86,16 +131,31 @@ class TestRGB_to_ICtCp(unittest.TestCase):
         n-dimensional support.
         """
 
-        RGB = np.array([0.45620519, 0.03081071, 0.04091952])
-        ICtCp = RGB_to_ICtCp(RGB)
+        ICtCp = RGB_to_ICtCp(_RGB)
 
-        RGB = np.tile(RGB, (6, 1))
-        ICtCp = np.tile(ICtCp, (6, 1))
-        np.testing.assert_almost_equal(RGB_to_ICtCp(RGB), ICtCp, decimal=7)
+        RGB = np.broadcast_to(_RGB, (6, 3))
+        ICtCp = np.broadcast_to(ICtCp, (6, 3))
+        np.testing.assert_allclose(RGB_to_ICtCp(RGB), ICtCp, atol=1e-7, rtol=0)
 
         RGB = np.reshape(RGB, (2, 3, 3))
         ICtCp = np.reshape(ICtCp, (2, 3, 3))
-        np.testing.assert_almost_equal(RGB_to_ICtCp(RGB), ICtCp, decimal=7)
+        np.testing.assert_allclose(RGB_to_ICtCp(RGB), ICtCp, atol=1e-7, rtol=0)
+
+    def test_blockwise_RGB_to_ICtCp(self):
+        """
+        Tests :func:`colour.models.rgb.ictcp.RGB_to_ICtCp` definition blockwise
+        evaluation of large arrays.
+        """
+
+        for RGB in _CASES_BLOCKWISE:
+            np.testing.assert_allclose(
+                RGB_to_ICtCp(RGB),
+                _encode_ICtCp(RGB, _MATRIX_ICTCP_RGB_TO_LMS_T),
+                atol=1e-7,
+                rtol=0)
+
+        for shape in _SHAPES_BLOCKWISE_INVALID:
+            self.assertRaises(ValueError, RGB_to_ICtCp, np.zeros(shape))
 
     def test_domain_range_scale_RGB_to_ICtCp(self):
         """
@@ -103,14 +163,15 @@ class TestRGB_to_ICtCp(unittest.TestCase):
         and range scale support.
         """
 
-        RGB = np.array([0.45620519, 0.03081071, 0.04091952])
-        ICtCp = RGB_to_ICtCp(RGB)
+        ICtCp = RGB_to_ICtCp(_RGB)
 
-        d_r = (('reference', 1), (1, 1), (100, 100))
-        for scale, factor in d_r:
+        for scale, factor in _DOMAIN_RANGE_SCALES:
             with domain_range_scale(scale):
-                np.testing.assert_almost_equal(
-                    RGB_to_ICtCp(RGB * factor), ICtCp * factor, decimal=7)
+                np.testing.assert_allclose(
+                    RGB_to_ICtCp(_RGB * factor),
+                    ICtCp * factor,
+                    atol=1e-7,
+                    rtol=0)
 
     @ignore_numpy_errors
     def test_nan_RGB_to_ICtCp(self):
@@ -119,11 +180,7 @@ class TestRGB_to_ICtCp(unittest.TestCase):
         support.
         """
 
-        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
-        cases = set(permutations(cases * 3, r=3))
-        for case in cases:
-            RGB = np.array(case)
-            RGB_to_ICtCp(RGB)
+        RGB_to_ICtCp(_CASES_NAN)
 
 
 class TestICtCp_to_RGB(unittest.TestCase):
@@ -137,50 +194,46 @@ class TestICtCp_to_RGB(unittest.TestCase):
         Tests :func:`colour.models.rgb.ictcp.ICtCp_to_RGB` definition.
         """
 
-        np.testing.assert_almost_equal(
-            ICtCp_to_RGB(np.array([0.07351364, 0.00475253, 0.09351596])),
-            np.array([0.45620519, 0.03081071, 0.04091952]),
-            decimal=7)
+        np.testing.assert_allclose(
+            ICtCp_to_RGB(_ICTCP), _RGB, atol=1e-7, rtol=0)
 
-        np.testing.assert_almost_equal(
-            ICtCp_to_RGB(
-                np.array([0.10516931, 0.00514031, 0.12318730]), L_p=4000),
-            np.array([0.45620519, 0.03081071, 0.04091952]),
-            decimal=7)
+        np.testing.assert_allclose(
+            ICtCp_to_RGB(_ICTCP_L_P_4000, L_p=4000), _RGB, atol=1e-7, rtol=0)
 
-        np.testing.assert_almost_equal(
-            ICtCp_to_RGB(
-                np.array([0.17079612, 0.00485580, 0.17431356]), L_p=1000),
-            np.array([0.45620519, 0.03081071, 0.04091952]),
-            decimal=7)
+        np.testing.assert_allclose(
+            ICtCp_to_RGB(_ICTCP_L_P_1000, L_p=1000), _RGB, atol=1e-7, rtol=0)
 
-        np.testing.assert_almost_equal(
+        np.testing.assert_allclose(
             ICtCp_to_RGB(
-                np.array([0.07351364, 0.00475253, 0.09351596]),
-                method='ITU-R BT.2100-1 PQ'),
-            np.array([0.45620519, 0.03081071, 0.04091952]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            ICtCp_to_RGB(
-                np.array([0.07351364, 0.00475253, 0.09351596]),
-                method='ITU-R BT.2100-2 PQ'),
-            np.array([0.45620519, 0.03081071, 0.04091952]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            ICtCp_to_RGB(
-                np.array([0.62567899, -0.03622422, 0.67786522]),
-                method='ITU-R BT.2100-1 HLG'),
-            np.array([0.45620519, 0.03081071, 0.04091952]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            ICtCp_to_RGB(
-                np.array([0.62567899, -0.01984490, 0.35911259]),
-                method='ITU-R BT.2100-2 HLG'),
-            np.array([0.45620519, 0.03081071, 0.04091952]),
-            decimal=7)
+                np.array([_ICTCP_L_P_1000, _ICTCP_L_P_4000]),
+                L_p=np.array([[1000], [4000]])),
+            np.broadcast_to(_RGB, (2, 3)),
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_RGB(_ICTCP, method='ITU-R BT.2100-1 PQ'),
+            _RGB,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_RGB(_ICTCP, method='ITU-R BT.2100-2 PQ'),
+            _RGB,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_RGB(_ICTCP_HLG_BT2100_1, method='ITU-R BT.2100-1 HLG'),
+            _RGB,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_RGB(_ICTCP_HLG_BT2100_2, method='ITU-R BT.2100-2 HLG'),
+            _RGB,
+            atol=1e-7,
+            rtol=0)
 
     def test_n_dimensional_ICtCp_to_RGB(self):
         """
@@ -188,16 +241,32 @@ class TestICtCp_to_RGB(unittest.TestCase):
         n-dimensional support.
         """
 
-        ICtCp = np.array([0.07351364, 0.00475253, 0.09351596])
-        RGB = ICtCp_to_RGB(ICtCp)
+        RGB = ICtCp_to_RGB(_ICTCP)
 
-        ICtCp = np.tile(ICtCp, (6, 1))
-        RGB = np.tile(RGB, (6, 1))
-        np.testing.assert_almost_equal(ICtCp_to_RGB(ICtCp), RGB, decimal=7)
+        ICtCp = np.broadcast_to(_ICTCP, (6, 3))
+        RGB = np.broadcast_to(RGB, (6, 3))
+        np.testing.assert_allclose(ICtCp_to_RGB(ICtCp), RGB, atol=1e-7, rtol=0)
 
         ICtCp = np.reshape(ICtCp, (2, 3, 3))
         RGB = np.reshape(RGB, (2, 3, 3))
-        np.testing.assert_almost_equal(ICtCp_to_RGB(ICtCp), RGB, decimal=7)
+        np.testing.assert_allclose(ICtCp_to_RGB(ICtCp), RGB, atol=1e-7, rtol=0)
+
+    def test_blockwise_ICtCp_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ictcp.ICtCp_to_RGB` definition blockwise
+        evaluation of large arrays.
+        """
+
+        for RGB in _CASES_BLOCKWISE:
+            ICtCp = _encode_ICtCp(RGB, _MATRIX_ICTCP_RGB_TO_LMS_T)
+            np.testing.assert_allclose(
+                ICtCp_to_RGB(ICtCp),
+                _decode_ICtCp(ICtCp, _MATRIX_ICTCP_LMS_TO_RGB_T),
+                atol=1e-7,
+                rtol=0)
+
+        for shape in _SHAPES_BLOCKWISE_INVALID:
+            self.assertRaises(ValueError, ICtCp_to_RGB, np.zeros(shape))
 
     def test_domain_range_scale_ICtCp_to_RGB(self):
         """
@@ -205,14 +274,15 @@ class TestICtCp_to_RGB(unittest.TestCase):
         and range scale support.
         """
 
-        ICtCp = np.array([0.07351364, 0.00475253, 0.09351596])
-        RGB = ICtCp_to_RGB(ICtCp)
+        RGB = ICtCp_to_RGB(_ICTCP)
 
-        d_r = (('reference', 1), (1, 1), (100, 100))
-        for scale, factor in d_r:
+        for scale, factor in _DOMAIN_RANGE_SCALES:
             with domain_range_scale(scale):
-                np.testing.assert_almost_equal(
-                    ICtCp_to_RGB(ICtCp * factor), RGB * factor, decimal=7)
+                np.testing.assert_allclose(
+                    ICtCp_to_RGB(_ICTCP * factor),
+                    RGB * factor,
+                    atol=1e-7,
+                    rtol=0)
 
     @ignore_numpy_errors
     def test_nan_ICtCp_to_RGB(self):
@@ -221,11 +291,7 @@ class TestICtCp_to_RGB(unittest.TestCase):
         support.
         """
 
-        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
-        cases = set(permutations(cases * 3, r=3))
-        for case in cases:
-            ICtCp = np.array(case)
-            ICtCp_to_RGB(ICtCp)
+        ICtCp_to_RGB(_CASES_NAN)
 
 
 class TestXYZ_to_ICtCp(unittest.TestCase):
@@ -239,65 +305,66 @@ class TestXYZ_to_ICtCp(unittest.TestCase):
         Tests :func:`colour.models.rgb.ictcp.XYZ_to_ICtCp` definition.
         """
 
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(np.array([0.20654008, 0.12197225, 0.05136952])),
-            np.array([0.06858097, -0.00283842, 0.06020983]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]),
-                np.array([0.34570, 0.35850])),
-            np.array([0.06792437, 0.00452089, 0.05514480]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]),
-                np.array([0.34570, 0.35850]),
-                chromatic_adaptation_transform='Bradford'),
-            np.array([0.06783951, 0.00476111, 0.05523093]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]), L_p=4000),
-            np.array([0.09871102, -0.00447247, 0.07984812]),
-            decimal=7)
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ), _ICTCP_XYZ, atol=1e-7, rtol=0)
 
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]), L_p=1000),
-            np.array([0.16173872, -0.00792543, 0.11409458]),
-            decimal=7)
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, _CCS_D50), _ICTCP_XYZ_D50, atol=1e-7, rtol=0)
 
-        np.testing.assert_almost_equal(
+        np.testing.assert_allclose(
             XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]),
-                method='ITU-R BT.2100-1 PQ'),
-            np.array([0.06858097, -0.00283842, 0.06020983]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]),
-                method='ITU-R BT.2100-2 PQ'),
-            np.array([0.06858097, -0.00283842, 0.06020983]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]),
-                method='ITU-R BT.2100-1 HLG'),
-            np.array([0.59242792, -0.06824263, 0.47421473]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            XYZ_to_ICtCp(
-                np.array([0.20654008, 0.12197225, 0.05136952]),
-                method='ITU-R BT.2100-2 HLG'),
-            np.array([0.59242792, -0.03740730, 0.25122675]),
-            decimal=7)
+                _XYZ, _CCS_D50, chromatic_adaptation_transform='Bradford'),
+            _ICTCP_XYZ_D50_BRADFORD,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, L_p=4000),
+            _ICTCP_XYZ_L_P_4000,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, L_p=1000),
+            _ICTCP_XYZ_L_P_1000,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, L_p=np.array([[1000], [4000]])),
+            np.array([_ICTCP_XYZ_L_P_1000, _ICTCP_XYZ_L_P_4000]),
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, method='ITU-R BT.2100-1 PQ'),
+            _ICTCP_XYZ,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, method='ITU-R BT.2100-2 PQ'),
+            _ICTCP_XYZ,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, method='ITU-R BT.2100-1 HLG'),
+            _ICTCP_XYZ_HLG_BT2100_1,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            XYZ_to_ICtCp(_XYZ, method='ITU-R BT.2100-2 HLG'),
+            _ICTCP_XYZ_HLG_BT2100_2,
+            atol=1e-7,
+            rtol=0)
+
+        self.assertRaises(
+            ValueError,
+            XYZ_to_ICtCp,
+            _XYZ,
+            chromatic_adaptation_transform='Undefined')
 
     def test_n_dimensional_XYZ_to_ICtCp(self):
         """
@@ -305,16 +372,31 @@ class TestXYZ_to_ICtCp(unittest.TestCase):
         n-dimensional support.
         """
 
-        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
-        ICtCp = XYZ_to_ICtCp(XYZ)
+        ICtCp = XYZ_to_ICtCp(_XYZ)
 
-        XYZ = np.tile(XYZ, (6, 1))
-        ICtCp = np.tile(ICtCp, (6, 1))
-        np.testing.assert_almost_equal(XYZ_to_ICtCp(XYZ), ICtCp, decimal=7)
+        XYZ = np.broadcast_to(_XYZ, (6, 3))
+        ICtCp = np.broadcast_to(ICtCp, (6, 3))
+        np.testing.assert_allclose(XYZ_to_ICtCp(XYZ), ICtCp, atol=1e-7, rtol=0)
 
         XYZ = np.reshape(XYZ, (2, 3, 3))
         ICtCp = np.reshape(ICtCp, (2, 3, 3))
-        np.testing.assert_almost_equal(XYZ_to_ICtCp(XYZ), ICtCp, decimal=7)
+        np.testing.assert_allclose(XYZ_to_ICtCp(XYZ), ICtCp, atol=1e-7, rtol=0)
+
+    def test_blockwise_XYZ_to_ICtCp(self):
+        """
+        Tests :func:`colour.models.rgb.ictcp.XYZ_to_ICtCp` definition blockwise
+        evaluation of large arrays.
+        """
+
+        for XYZ in _CASES_BLOCKWISE:
+            np.testing.assert_allclose(
+                XYZ_to_ICtCp(XYZ),
+                _encode_ICtCp(XYZ, _MATRIX_ICTCP_XYZ_TO_LMS_T),
+                atol=1e-7,
+                rtol=0)
+
+        for shape in _SHAPES_BLOCKWISE_INVALID:
+            self.assertRaises(ValueError, XYZ_to_ICtCp, np.zeros(shape))
 
     def test_domain_range_scale_XYZ_to_ICtCp(self):
         """
@@ -322,14 +404,15 @@ class TestXYZ_to_ICtCp(unittest.TestCase):
         and range scale support.
         """
 
-        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
-        ICtCp = XYZ_to_ICtCp(XYZ)
+        ICtCp = XYZ_to_ICtCp(_XYZ)
 
-        d_r = (('reference', 1), (1, 1), (100, 100))
-        for scale, factor in d_r:
+        for scale, factor in _DOMAIN_RANGE_SCALES:
             with domain_range_scale(scale):
-                np.testing.assert_almost_equal(
-                    XYZ_to_ICtCp(XYZ * factor), ICtCp * factor, decimal=7)
+                np.testing.assert_allclose(
+                    XYZ_to_ICtCp(_XYZ * factor),
+                    ICtCp * factor,
+                    atol=1e-7,
+                    rtol=0)
 
     @ignore_numpy_errors
     def test_nan_XYZ_to_ICtCp(self):
@@ -338,11 +421,7 @@ class TestXYZ_to_ICtCp(unittest.TestCase):
         support.
         """
 
-        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
-        cases = set(permutations(cases * 3, r=3))
-        for case in cases:
-            XYZ = np.array(case)
-            XYZ_to_ICtCp(XYZ)
+        XYZ_to_ICtCp(_CASES_NAN)
 
 
 class TestICtCp_to_XYZ(unittest.TestCase):
@@ -356,65 +435,72 @@ class TestICtCp_to_XYZ(unittest.TestCase):
         Tests :func:`colour.models.rgb.ictcp.ICtCp_to_XYZ` definition.
         """
 
-        np.testing.assert_almost_equal(
-            ICtCp_to_XYZ(np.array([0.06858097, -0.00283842, 0.06020983])),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
+        np.testing.assert_allclose(
+            ICtCp_to_XYZ(_ICTCP_XYZ), _XYZ, atol=1e-7, rtol=0)
 
-        np.testing.assert_almost_equal(
-            ICtCp_to_XYZ(
-                np.array([0.06792437, 0.00452089, 0.05514480]),
-                np.array([0.34570, 0.35850])),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
+        np.testing.assert_allclose(
+            ICtCp_to_XYZ(_ICTCP_XYZ_D50, _CCS_D50), _XYZ, atol=1e-7, rtol=0)
 
-        np.testing.assert_almost_equal(
+        np.testing.assert_allclose(
             ICtCp_to_XYZ(
-                np.array([0.06783951, 0.00476111, 0.05523093]),
-                np.array([0.34570, 0.35850]),
+                _ICTCP_XYZ_D50_BRADFORD,
+                _CCS_D50,
                 chromatic_adaptation_transform='Bradford'),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
+            _XYZ,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_XYZ(_ICTCP_XYZ_L_P_4000, L_p=4000),
+            _XYZ,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_XYZ(_ICTCP_XYZ_L_P_1000, L_p=1000),
+            _XYZ,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
             ICtCp_to_XYZ(
-                np.array([0.09871102, -0.00447247, 0.07984812]), L_p=4000),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
+                np.array([_ICTCP_XYZ_L_P_1000, _ICTCP_XYZ_L_P_4000]),
+                L_p=np.array([[1000], [4000]])),
+            np.broadcast_to(_XYZ, (2, 3)),
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_XYZ(_ICTCP_XYZ, method='ITU-R BT.2100-1 PQ'),
+            _XYZ,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
+            ICtCp_to_XYZ(_ICTCP_XYZ, method='ITU-R BT.2100-2 PQ'),
+            _XYZ,
+            atol=1e-7,
+            rtol=0)
+
+        np.testing.assert_allclose(
             ICtCp_to_XYZ(
-                np.array([0.16173872, -0.00792543, 0.11409458]), L_p=1000),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
+                _ICTCP_XYZ_HLG_BT2100_1, method='ITU-R BT.2100-1 HLG'),
+            _XYZ,
+            atol=1e-7,
+            rtol=0)
 
-        np.testing.assert_almost_equal(
+        np.testing.assert_allclose(
             ICtCp_to_XYZ(
-                np.array([0.06858097, -0.00283842, 0.06020983]),
-                method='ITU-R BT.2100-1 PQ'),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
+                _ICTCP_XYZ_HLG_BT2100_2, method='ITU-R BT.2100-2 HLG'),
+            _XYZ,
+            atol=1e-7,
+            rtol=0)
 
-        np.testing.assert_almost_equal(
-            ICtCp_to_XYZ(
-                np.array([0.06858097, -0.00283842, 0.06020983]),
-                method='ITU-R BT.2100-2 PQ'),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            ICtCp_to_XYZ(
-                np.array([0.59242792, -0.06824263, 0.47421473]),
-                method='ITU-R BT.2100-1 HLG'),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
-
-        np.testing.assert_almost_equal(
-            ICtCp_to_XYZ(
-                np.array([0.59242792, -0.03740730, 0.25122675]),
-                method='ITU-R BT.2100-2 HLG'),
-            np.array([0.20654008, 0.12197225, 0.05136952]),
-            decimal=7)
+        self.assertRaises(
+            ValueError,
+            ICtCp_to_XYZ,
+            _ICTCP_XYZ,
+            chromatic_adaptation_transform='Undefined')
 
     def test_n_dimensional_ICtCp_to_XYZ(self):
         """
@@ -422,16 +508,32 @@ class TestICtCp_to_XYZ(unittest.TestCase):
         n-dimensional support.
         """
 
-        ICtCp = np.array([0.06858097, -0.00283842, 0.06020983])
-        XYZ = ICtCp_to_XYZ(ICtCp)
+        XYZ = ICtCp_to_XYZ(_ICTCP_XYZ)
 
-        ICtCp = np.tile(ICtCp, (6, 1))
-        XYZ = np.tile(XYZ, (6, 1))
-        np.testing.assert_almost_equal(ICtCp_to_XYZ(ICtCp), XYZ, decimal=7)
+        ICtCp = np.broadcast_to(_ICTCP_XYZ, (6, 3))
+        XYZ = np.broadcast_to(XYZ, (6, 3))
+        np.testing.assert_allclose(ICtCp_to_XYZ(ICtCp), XYZ, atol=1e-7, rtol=0)
 
         ICtCp = np.reshape(ICtCp, (2, 3, 3))
         XYZ = np.reshape(XYZ, (2, 3, 3))
-        np.testing.assert_almost_equal(ICtCp_to_XYZ(ICtCp), XYZ, decimal=7)
+        np.testing.assert_allclose(ICtCp_to_XYZ(ICtCp), XYZ, atol=1e-7, rtol=0)
+
+    def test_blockwise_ICtCp_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.ictcp.ICtCp_to_XYZ` definition blockwise
+        evaluation of large arrays.
+        """
+
+        for XYZ in _CASES_BLOCKWISE:
+            ICtCp = _encode_ICtCp(XYZ, _MATRIX_ICTCP_XYZ_TO_LMS_T)
+            np.testing.assert_allclose(
+                ICtCp_to_XYZ(ICtCp),
+                _decode_ICtCp(ICtCp, _MATRIX_ICTCP_LMS_TO_XYZ_T),
+                atol=1e-7,
+                rtol=0)
+
+        for shape in _SHAPES_BLOCKWISE_INVALID:
+            self.assertRaises(ValueError, ICtCp_to_XYZ, np.zeros(shape))
 
     def test_domain_range_scale_ICtCp_to_XYZ(self):
         """
@@ -439,14 +541,15 @@ class TestICtCp_to_XYZ(unittest.TestCase):
         and range scale support.
         """
 
-        ICtCp = np.array([0.06858097, -0.00283842, 0.06020983])
-        XYZ = ICtCp_to_XYZ(ICtCp)
+        XYZ = ICtCp_to_XYZ(_ICTCP_XYZ)
 
-        d_r = (('reference', 1), (1, 1), (100, 100))
-        for scale, factor in d_r:
+        for scale, factor in _DOMAIN_RANGE_SCALES:
             with domain_range_scale(scale):
-                np.testing.assert_almost_equal(
-                    ICtCp_to_XYZ(ICtCp * factor), XYZ * factor, decimal=7)
+                np.testing.assert_allclose(
+                    ICtCp_to_XYZ(_ICTCP_XYZ * factor),
+                    XYZ * factor,
+                    atol=1e-7,
+                    rtol=0)
 
     @ignore_numpy_errors
     def test_nan_ICtCp_to_XYZ(self):
@@ -455,11 +558,7 @@ class TestICtCp_to_XYZ(unittest.TestCase):
         support.
         """
 
-        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
-        cases = set(permutations(cases * 3, r=3))
-        for case in cases:
-            ICtCp = np.array(case)
-            ICtCp_to_XYZ(ICtCp)
+        ICtCp_to_XYZ(_CASES_NAN)
 
 
 if __name__ == '__main__':
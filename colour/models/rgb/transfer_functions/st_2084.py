@@ -113,8 +113,16 @@ def eotf_inverse_ST2084(C, L_p=10000, constants=CONSTANTS_ST2084):
 
     Y_p = spow(C / L_p, constants.m_1)
 
-    N = spow((constants.c_1 + constants.c_2 * Y_p) / (constants.c_3 * Y_p + 1),
-             constants.m_2)
+    # The intermediate computations are performed in-place to limit the
+    # number of temporary arrays allocated for large inputs, "Y_p" already
+    # has the broadcast shape of "C" and "L_p".
+    N = constants.c_2 * Y_p
+    N += constants.c_1
+    Y_p *= constants.c_3
+    Y_p += 1
+    N /= Y_p
+
+    N = spow(N, constants.m_2)
 
     return from_range_1(N)
 
@@ -189,9 +197,15 @@ def eotf_ST2084(N, L_p=10000, constants=CONSTANTS_ST2084):
 
     n = V_p - constants.c_1
     # Limiting negative values.
-    n = np.where(n < 0, 0, n)
+    n = np.maximum(n, 0)
+
+    # The intermediate computations are performed in-place to limit the
+    # number of temporary arrays allocated for large inputs.
+    V_p *= -constants.c_3
+    V_p += constants.c_2
+    n /= V_p
 
-    L = spow((n / (constants.c_2 - constants.c_3 * V_p)), m_1_d)
+    L = spow(n, m_1_d)
     C = L_p * L
 
     return from_range_1(C)
@@ -44,6 +44,11 @@ eotf_inverse_ST2084` definition.
 
         self.assertAlmostEqual(eotf_inverse_ST2084(5000, 5000), 1.0, places=7)
 
+        np.testing.assert_almost_equal(
+            eotf_inverse_ST2084(100, np.array([1000, 10000])),
+            np.array([0.751827096247, 0.508078421517]),
+            decimal=7)
+
     def test_n_dimensional_eotf_inverse_ST2084(self):
         """
         Tests :func:`colour.models.rgb.transfer_functions.st_2084.\
@@ -111,6 +116,12 @@ eotf_ST2084` definition.
 
         self.assertAlmostEqual(eotf_ST2084(1.0, 5000), 5000.0, places=7)
 
+        np.testing.assert_almost_equal(
+            eotf_ST2084(np.array([0.5, 0.6]), np.array([[1000], [10000]])),
+            np.array([[9.224570899407, 24.400519233637],
+                      [92.245708994065, 244.005192336370]]),
+            decimal=7)
+
     def test_n_dimensional_eotf_ST2084(self):
         """
         Tests :func:`colour.models.rgb.transfer_functions.st_2084.\